@@ -7,16 +7,43 @@ Outputs JSON status messages to stdout for integration with NeuroFlow.
 
 Usage:
   python transcript_summarizer.py --input-dir <path> --output-dir <path>
+
+Optional packages:
+  watchdog - file stability checks react to filesystem events instead of polling
+  orjson   - faster JSON encoding/decoding for status messages and LLM responses
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import requests
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 # Defaults
 LMSTUDIO_BASE_URL = os.getenv("LMSTUDIO_BASE_URL", "http://localhost:1234/v1").rstrip("/")
@@ -27,14 +54,148 @@ LLM_MODEL = os.getenv("LLM_MODEL", "gpt-oss-20b-uncensored")
 SUMMARY_WORDS = (320, 500)
 BULLET_COUNT = 12
 
+# Prompts only depend on the tuning knobs, so build them once
+_SYSTEM_PROMPT = (
+    "You are generating an Obsidian-compatible Markdown note.\n"
+    "OUTPUT REQUIREMENTS:\n"
+    "1) Output a COMPLETE Markdown document that STARTS with YAML frontmatter delimited by '---'.\n"
+    "   There should no whitespaces after the '---' \n"
+    "2) If the INPUT already has YAML frontmatter, COPY all existing fields and values unless updated below. "
+    "   Preserve unknown keys. Keep YAML lists as lists (not comma strings).\n"
+    "3) FRONTMATTER UPDATES (MANDATORY):\n"
+    "   - Overwrite 'status' with 'summarized'.\n"
+    "   - Ensure 'tags' is a YAML list; remove 'unprocessed' and 'ready-for-processing' if present; add 'summarized' if missing.\n"
+    "   - Generate 6–12 domain-relevant, lowercase, hyphenated content tags (no '#', no spaces, no punctuation) "
+    "     based on the content. EXCLUDE generic media tags like 'youtube', 'video', 'transcript' from 'content_tags'.\n"
+    "   - Append those content-derived tags to 'tags' (dedupe). Also write them to a separate 'content_tags' YAML list.\n"
+    "   - If absent, add 'processed_date' as an ISO 8601 timestamp.\n"
+    "   - Preserve fields like 'title', 'url', 'video_id', 'channel', 'duration' exactly if they exist.\n"
+    "4) BODY SECTIONS (after frontmatter):\n"
+    "   - '# {title}' (reuse existing title; if missing, create a concise one)\n"
+    f"   - '## Summary' (~{SUMMARY_WORDS[0]}–{SUMMARY_WORDS[1]} words, plain text)\n"
+    f"   - '## Key Points' (exactly {BULLET_COUNT} concise bullets)\n"
+    "   - '## Source' listing url/channel/duration if present\n"
+    "   - Do NOT include the raw transcript text.\n"
+    "5) STYLE:\n"
+    "   - This is a Markdown file for **Obsidian**.\n"
+    "   - Use lowercase, hyphenated tags; YAML lists; no trailing spaces.\n"
+    "   - NO code fences, NO backticks, NO extra commentary, NO reasoning—only the final note."
+)
+
+_USER_PROMPT_PREFIX = (
+    "INPUT NOTE (may include YAML frontmatter and transcript/body):\n"
+    "-----BEGIN NOTE-----\n"
+)
+_USER_PROMPT_SUFFIX = (
+    "\n-----END NOTE-----\n\n"
+    "Now produce the final Obsidian Markdown per the OUTPUT REQUIREMENTS above.\n"
+    "Do not add any other sections."
+)
+
+# Shared HTTP session so LM Studio and thumbnail calls reuse connections.
+# Created on first use so runs without pending files skip importing requests.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+# Background thumbnail fetches overlapping the LM Studio call, created on first use
+_THUMBNAIL_POOL = None
+_THUMBNAIL_POOL_LOCK = threading.Lock()
+
+_HOME = os.path.expanduser("~")
+
+_EMIT_LOCK = threading.Lock()
+
+
+def emit(msg_type: str, flush: bool = True, **data):
+    """Output JSON status message for NeuroFlow integration.
+
+    Pass flush=False for intermediate progress; the line goes out with the
+    next flushed message.
+    """
+    line = _json_dumps({"type": msg_type, **data}) + b"\n"
+    with _EMIT_LOCK:
+        sys.stdout.buffer.write(line)
+        if flush:
+            sys.stdout.flush()
+
+
+class _WriteTracker(FileSystemEventHandler):
+    """Track the last write event per file and wake threads waiting on it."""
+
+    def __init__(self):
+        super().__init__()
+        self._last_event: dict[str, float] = {}
+        self._cond = threading.Condition()
+
+    def on_created(self, event):
+        self._touch(event.src_path)
+
+    def on_modified(self, event):
+        self._touch(event.src_path)
+
+    def on_moved(self, event):
+        self._touch(event.dest_path)
+
+    def _touch(self, src_path):
+        with self._cond:
+            self._last_event[os.fsdecode(src_path)] = time.time()
+            self._cond.notify_all()
+
+    def wait_quiet(self, path: Path, quiet: float, timeout: float) -> bool:
+        """Wait until no write event has been seen for `quiet` seconds.
+
+        Without any event for the file, its mtime stands in for the last
+        write, capped at the start of the wait so a future mtime (clock
+        skew, synced files) cannot stall it.
+        """
+        start = time.time()
+        deadline = start + timeout
+        with self._cond:
+            while True:
+                now = time.time()
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    st = None
+                if st is not None and st.st_size > 0:
+                    last = self._last_event.get(str(path))
+                    if last is None:
+                        last = min(st.st_mtime, start)
+                    remaining = last + quiet - now
+                    if remaining <= 0:
+                        return True
+                else:
+                    remaining = quiet
+                if now >= deadline:
+                    return False
+                self._cond.wait(min(remaining, deadline - now))
+
+
+def wait_for_stable(
+    path: Path,
+    stable_checks=3,
+    interval=1.0,
+    timeout=300,
+    tracker: _WriteTracker | None = None
+) -> bool:
+    """Wait until a file is non-empty and no longer being written.
+
+    Returns immediately for files untouched longer than the stability
+    window. With a tracker, waits for write events to go quiet; otherwise
+    polls until the size is unchanged for `stable_checks` intervals.
+    """
+    if tracker is not None:
+        return tracker.wait_quiet(path, stable_checks * interval, timeout)
+
+    # Already untouched for longer than the stability window
+    try:
+        st = path.stat()
+        if st.st_size > 0 and time.time() - st.st_mtime >= stable_checks * interval:
+            return True
+    except FileNotFoundError:
+        pass
 
-def emit(msg_type: str, **data):
-    """Output JSON status message for NeuroFlow integration."""
-    print(json.dumps({"type": msg_type, **data}), flush=True)
-
-
-def wait_for_stable(path: Path, stable_checks=3, interval=1.0, timeout=300) -> bool:
-    """Wait until file size stops changing."""
     last = -1
     steady = 0
     deadline = time.time() + timeout
@@ -55,174 +216,339 @@ def wait_for_stable(path: Path, stable_checks=3, interval=1.0, timeout=300) -> b
     return False
 
 
-def list_pending_files(input_dir: Path) -> list[Path]:
-    """List all .md files in the input directory."""
-    return sorted([p for p in input_dir.glob("*.md") if p.is_file()])
+def expand_home(path: str) -> str:
+    """Expand a leading '~' using the home directory resolved at startup."""
+    if path == "~" or path.startswith("~/"):
+        return path.replace("~", _HOME, 1)
+    return path
 
 
-_YT_ID = r"([A-Za-z0-9_-]{11})"
+def list_pending_files(input_dir: Path, sort: bool = False) -> list[Path]:
+    """List all .md files in the input directory.
 
+    Uses the file type cached by os.scandir, so regular files cost no extra
+    stat() call. Hidden files are skipped, as with glob("*.md").
+    """
+    with os.scandir(input_dir) as it:
+        pending = [
+            input_dir / entry.name
+            for entry in it
+            if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file()
+        ]
+    if sort:
+        pending.sort()
+    return pending
 
-def extract_video_id(text: str) -> str | None:
-    """Extract YouTube video ID from text."""
-    # YAML field
-    m = re.search(r"^\s*video_id\s*:\s*['\"]?" + _YT_ID + r"['\"]?\s*$", text, re.M)
-    if m:
-        return m.group(1)
-
-    # URL fields
-    for field in ("url", "source_url", "original_url"):
-        m = re.search(rf"^\s*{field}\s*:\s*['\"]?(.+?)['\"]?\s*$", text, re.M)
-        if m:
-            vid = _extract_from_url(m.group(1))
-            if vid:
-                return vid
-
-    # Any YouTube URL
-    urls = re.findall(r"(https?://[^\s)>\]]+)", text)
-    for u in urls:
-        vid = _extract_from_url(u)
-        if vid:
-            return vid
 
-    return None
+_YT_ID = r"[A-Za-z0-9_-]{11}"
 
+# Frontmatter and leading URLs normally fit in the head of a transcript
+_ID_SCAN_CHARS = 8192
 
-def _extract_from_url(u: str) -> str | None:
-    m = re.search(r"[?&]v=" + _YT_ID + r"(\b|&|#|/)", u)
-    if m:
-        return m.group(1)
-    m = re.search(r"youtu\.be/" + _YT_ID + r"(\b|[?&#/])", u)
-    if m:
-        return m.group(1)
-    m = re.search(r"youtube\.com/shorts/" + _YT_ID + r"(\b|[?&#/])", u)
-    if m:
-        return m.group(1)
-    return None
+# Single-pass video ID extraction: a YAML video_id field or any YouTube URL form
+_COMBINED_ID_RE = re.compile(
+    r"(?:^\s*video_id\s*:\s*['\"]?(?P<yaml>" + _YT_ID + r")['\"]?\s*$)"
+    r"|(?:[?&]v=(?P<vparam>" + _YT_ID + r")(?:\b|[&#/]))"
+    r"|(?:youtu\.be/(?P<short>" + _YT_ID + r")(?:\b|[?&#/]))"
+    r"|(?:youtube\.com/shorts/(?P<shorts>" + _YT_ID + r")(?:\b|[?&#/]))",
+    re.M,
+)
 
+# Transcript cleanup before prompting: frontmatter is kept verbatim, while
+# leading timecodes and whitespace runs in the body only cost tokens
+_FRONTMATTER_RE = re.compile(r"\A---\r?\n.*?\r?\n---[ \t]*(?:\r?\n|\Z)", re.S)
+_TIMECODE_RE = re.compile(r"^[ \t]*\[?\d{1,2}:\d{2}(?::\d{2})?\]?[ \t]*", re.M)
+_WHITESPACE_RE = re.compile(r"\s+")
 
-def download_thumbnail(video_id: str, asset_template: str) -> Path | None:
-    """Download YouTube thumbnail."""
-    url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-    out_path = Path(os.path.expanduser(asset_template.format(videoId=video_id)))
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+# Hash of the transcript a summary was made from, kept in its frontmatter
+_SOURCE_HASH_RE = re.compile(r"^source_sha1:[ \t]*(\S*)[ \t]*(?:\r?\n|\Z)", re.M)
 
-    if out_path.exists() and out_path.stat().st_size > 0:
-        return out_path
+# Accidental code fences around LLM output
+_CODE_FENCE_RE = re.compile(r"^```(?:markdown|md)?\s*|\s*```$", re.S)
+
+
+def extract_video_id(text: str) -> str | None:
+    """Extract YouTube video ID from text.
+
+    A YAML video_id field wins; otherwise the first YouTube URL in the text.
+    """
+    # Cheap substring checks before running the regex over the whole text
+    if "video_id" not in text and "youtu" not in text and "v=" not in text:
+        return None
 
+    first_url_id = None
+    for m in _COMBINED_ID_RE.finditer(text):
+        if m.group("yaml"):
+            return m.group("yaml")
+        if first_url_id is None:
+            first_url_id = m.group("vparam") or m.group("short") or m.group("shorts")
+    return first_url_id
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def _get_thumbnail_pool() -> ThreadPoolExecutor:
+    """Return the shared thumbnail executor, creating it on first use."""
+    global _THUMBNAIL_POOL
+    with _THUMBNAIL_POOL_LOCK:
+        if _THUMBNAIL_POOL is None:
+            _THUMBNAIL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="thumbnail")
+        return _THUMBNAIL_POOL
+
+
+def _cached_thumbnail(video_id: str, asset_template: str) -> tuple[Path, bool]:
+    """Return the thumbnail path and whether a non-empty copy already exists."""
+    out_path = Path(asset_template.format(videoId=video_id))
     try:
-        r = requests.get(url, timeout=30)
-        if r.status_code != 200:
+        return out_path, out_path.stat().st_size > 0
+    except FileNotFoundError:
+        return out_path, False
+
+
+def fetch_thumbnail(video_id: str) -> bytes | None:
+    """Fetch YouTube thumbnail bytes without writing them anywhere."""
+    url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
+    try:
+        r = _get_session().get(url, timeout=30)
+        if r.status_code != 200 or not r.content:
             return None
-        out_path.write_bytes(r.content)
-        return out_path
+        return r.content
     except Exception:
         return None
 
 
+def save_thumbnail(data: bytes, out_path: Path) -> Path:
+    """Write thumbnail bytes into the asset directory."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write via a temp file so an interrupted write never leaves an
+    # empty or truncated thumbnail that would be trusted as cached
+    tmp = out_path.with_name(f"{out_path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(out_path)
+    return out_path
+
+
+def download_thumbnail(video_id: str, asset_template: str) -> Path | None:
+    """Download YouTube thumbnail.
+
+    `asset_template` is expected to be home-expanded already (see main).
+    """
+    out_path, cached = _cached_thumbnail(video_id, asset_template)
+    if cached:
+        return out_path
+
+    data = fetch_thumbnail(video_id)
+    if data is None:
+        return None
+    return save_thumbnail(data, out_path)
+
+
+def _read_stream(resp) -> tuple[str, str, str]:
+    """Concatenate streamed chat completion deltas from an SSE response.
+
+    Falls back to a plain JSON completion body for servers that ignore
+    "stream". Returns (content, reasoning, raw) where raw holds the first
+    lines received, for error reporting.
+    """
+    content = []
+    reasoning = []
+    raw = []
+    plain = []
+    streamed = False
+    for line in resp.iter_lines():
+        if not line:
+            continue
+        if len(raw) < 20:
+            raw.append(line)
+        if not line.startswith(b"data:"):
+            plain.append(line)
+            continue
+        streamed = True
+        chunk = line[5:].strip()
+        if chunk == b"[DONE]":
+            break
+        delta = (_json_loads(chunk).get("choices") or [{}])[0].get("delta") or {}
+        content.append(delta.get("content") or "")
+        reasoning.append(delta.get("reasoning") or "")
+
+    if not streamed and plain:
+        try:
+            data = _json_loads(b"\n".join(plain))
+        except ValueError:
+            data = {}
+        msg = (data.get("choices") or [{}])[0].get("message") or {}
+        content.append(msg.get("content") or "")
+        reasoning.append(msg.get("reasoning") or "")
+
+    return "".join(content), "".join(reasoning), b"\n".join(raw).decode("utf-8", "replace")
+
+
+def clean_transcript(text: str) -> str:
+    """Strip timecodes and collapse whitespace in the body, keeping frontmatter."""
+    m = _FRONTMATTER_RE.match(text)
+    frontmatter = m.group(0) if m else ""
+    body = text[m.end():] if m else text
+    body = _TIMECODE_RE.sub("", body)
+    body = _WHITESPACE_RE.sub(" ", body).strip()
+    return frontmatter + body
+
+
 def call_lm_studio_markdown(input_text: str, endpoint: str, model: str) -> str:
     """Send note to LM Studio for summarization."""
-    min_w, max_w = SUMMARY_WORDS
-
-    system_prompt = (
-        "You are generating an Obsidian-compatible Markdown note.\n"
-        "OUTPUT REQUIREMENTS:\n"
-        "1) Output a COMPLETE Markdown document that STARTS with YAML frontmatter delimited by '---'.\n"
-        "   There should no whitespaces after the '---' \n"
-        "2) If the INPUT already has YAML frontmatter, COPY all existing fields and values unless updated below. "
-        "   Preserve unknown keys. Keep YAML lists as lists (not comma strings).\n"
-        "3) FRONTMATTER UPDATES (MANDATORY):\n"
-        "   - Overwrite 'status' with 'summarized'.\n"
-        "   - Ensure 'tags' is a YAML list; remove 'unprocessed' and 'ready-for-processing' if present; add 'summarized' if missing.\n"
-        "   - Generate 6–12 domain-relevant, lowercase, hyphenated content tags (no '#', no spaces, no punctuation) "
-        "     based on the content. EXCLUDE generic media tags like 'youtube', 'video', 'transcript' from 'content_tags'.\n"
-        "   - Append those content-derived tags to 'tags' (dedupe). Also write them to a separate 'content_tags' YAML list.\n"
-        "   - If absent, add 'processed_date' as an ISO 8601 timestamp.\n"
-        "   - Preserve fields like 'title', 'url', 'video_id', 'channel', 'duration' exactly if they exist.\n"
-        "4) BODY SECTIONS (after frontmatter):\n"
-        "   - '# {title}' (reuse existing title; if missing, create a concise one)\n"
-        f"   - '## Summary' (~{min_w}–{max_w} words, plain text)\n"
-        f"   - '## Key Points' (exactly {BULLET_COUNT} concise bullets)\n"
-        "   - '## Source' listing url/channel/duration if present\n"
-        "   - Do NOT include the raw transcript text.\n"
-        "5) STYLE:\n"
-        "   - This is a Markdown file for **Obsidian**.\n"
-        "   - Use lowercase, hyphenated tags; YAML lists; no trailing spaces.\n"
-        "   - NO code fences, NO backticks, NO extra commentary, NO reasoning—only the final note."
-    )
-
-    user_prompt = (
-        "INPUT NOTE (may include YAML frontmatter and transcript/body):\n"
-        "-----BEGIN NOTE-----\n"
-        f"{input_text}\n"
-        "-----END NOTE-----\n\n"
-        "Now produce the final Obsidian Markdown per the OUTPUT REQUIREMENTS above.\n"
-        "Do not add any other sections."
-    )
+    user_prompt = _USER_PROMPT_PREFIX + clean_transcript(input_text) + _USER_PROMPT_SUFFIX
 
     payload = {
         "model": model,
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ],
         "temperature": 0.3,
         "max_tokens": 3000,
+        "stream": True,
     }
 
-    resp = requests.post(endpoint, json=payload, timeout=1000)
-    if resp.status_code >= 400:
-        raise RuntimeError(f"LM Studio error {resp.status_code}: {resp.text}")
+    with _get_session().post(endpoint, json=payload, timeout=1000, stream=True) as resp:
+        if resp.status_code >= 400:
+            raise RuntimeError(f"LM Studio error {resp.status_code}: {resp.text}")
+        content, reasoning, raw = _read_stream(resp)
 
-    data = resp.json()
-    msg = data.get("choices", [{}])[0].get("message", {})
-    out = (msg.get("content") or msg.get("reasoning") or "").strip()
+    out = (content or reasoning).strip()
 
     if not out:
-        raise RuntimeError(f"Empty assistant message. Raw: {resp.text[:800]}")
+        raise RuntimeError(f"Empty assistant message. Raw: {raw[:800]}")
 
     # Strip accidental code fences
     if out.startswith("```"):
-        out = re.sub(r"^```(?:markdown|md)?\s*|\s*```$", "", out, flags=re.S).strip()
+        out = _CODE_FENCE_RE.sub("", out).strip()
 
     return out + ("\n" if not out.endswith("\n") else "")
 
 
+def _with_source_hash(summary_md: str, source_sha1: str) -> str:
+    """Record the source hash in the summary's frontmatter, if it has one."""
+    m = _FRONTMATTER_RE.match(summary_md)
+    if not m:
+        return summary_md
+    frontmatter = _SOURCE_HASH_RE.sub("", m.group(0))
+    opening_end = frontmatter.index("\n") + 1
+    return (
+        frontmatter[:opening_end]
+        + f"source_sha1: {source_sha1}\n"
+        + frontmatter[opening_end:]
+        + summary_md[m.end():]
+    )
+
+
+def _existing_summary(out_path: Path, source_sha1: str) -> str | None:
+    """Return the existing summary if it was made from a source with this hash."""
+    try:
+        summary_md = out_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    m = _FRONTMATTER_RE.match(summary_md)
+    h = _SOURCE_HASH_RE.search(m.group(0)) if m else None
+    if h and h.group(1) == source_sha1:
+        return summary_md
+    return None
+
+
 def process_file(
     src_path: Path,
     out_dir: Path,
     endpoint: str,
     model: str,
-    asset_template: str | None = None
+    asset_template: str | None = None,
+    tracker: _WriteTracker | None = None,
+    atomic_write: bool = True
 ) -> dict:
     """Process a single transcript file."""
-    emit("progress", file=str(src_path), stage="reading")
+    emit("progress", flush=False, file=str(src_path), stage="reading")
 
-    if not wait_for_stable(src_path, stable_checks=3, interval=1.0, timeout=60):
+    if not wait_for_stable(src_path, stable_checks=3, interval=1.0, timeout=60, tracker=tracker):
         raise RuntimeError("File did not become stable in time.")
 
     text = src_path.read_text(encoding="utf-8")
-    video_id = extract_video_id(text)
-
-    emit("progress", file=str(src_path), stage="summarizing")
-    summary_md = call_lm_studio_markdown(text, endpoint, model)
-
-    # Try to extract video_id from LLM output if not found earlier
-    if not video_id:
-        video_id = extract_video_id(summary_md)
+    # Cut the head at a line break so no URL or YAML value is truncated
+    head_end = text.find("\n", _ID_SCAN_CHARS)
+    head = text if head_end == -1 else text[:head_end]
+    video_id = extract_video_id(head)
+    if not video_id and len(head) < len(text):
+        video_id = extract_video_id(text)
+
+    # Video ID known up front: fetch the thumbnail while the LLM runs. It is
+    # only saved once the note has been written.
+    thumb_path = None
+    thumb_future = None
+    if asset_template and video_id:
+        try:
+            thumb_out, cached = _cached_thumbnail(video_id, asset_template)
+            if cached:
+                thumb_path = thumb_out
+            else:
+                thumb_future = _get_thumbnail_pool().submit(fetch_thumbnail, video_id)
+        except Exception:
+            # e.g. a bad asset template; the note is still summarized
+            pass
 
-    out_dir.mkdir(parents=True, exist_ok=True)
-    out_name = src_path.name
-    out_path = out_dir / out_name
+    out_path = out_dir / src_path.name
+    source_sha1 = hashlib.sha1(text.encode("utf-8")).hexdigest()
 
-    # Write atomically
-    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
-    tmp.write_text(summary_md, encoding="utf-8")
-    tmp.replace(out_path)
+    try:
+        existing_md = _existing_summary(out_path, source_sha1)
+        if existing_md is not None:
+            # Summary of this exact transcript left by an earlier run that
+            # stopped before removing the source
+            emit("progress", flush=False, file=str(src_path), stage="cached")
+            if not video_id:
+                video_id = extract_video_id(existing_md)
+        else:
+            emit("progress", file=str(src_path), stage="summarizing")
+            summary_md = call_lm_studio_markdown(text, endpoint, model)
+
+            # Try to extract video_id from LLM output if not found earlier
+            if not video_id:
+                video_id = extract_video_id(summary_md)
+
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            # Only complete (atomic) writes carry the source hash, so a file
+            # truncated by a crash mid-write is never reused
+            if atomic_write:
+                tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+                tmp.write_text(_with_source_hash(summary_md, source_sha1), encoding="utf-8")
+                tmp.replace(out_path)
+            else:
+                out_path.write_bytes(summary_md.encode("utf-8"))
+    except Exception:
+        # No note produced, so drop any pending thumbnail
+        if thumb_future is not None:
+            thumb_future.cancel()
+        raise
 
-    # Download thumbnail if possible
-    thumb_path = None
-    if asset_template and video_id:
+    # Save or download thumbnail if possible
+    if thumb_future is not None:
+        try:
+            data = thumb_future.result(timeout=60)
+            if data is not None:
+                thumb_path = save_thumbnail(data, thumb_out)
+        except Exception:
+            pass
+    elif thumb_path is None and asset_template and video_id:
         try:
             thumb_path = download_thumbnail(video_id, asset_template)
         except Exception:
@@ -268,10 +594,28 @@ def main():
         default=LLM_MODEL,
         help=f"Model name (default: {LLM_MODEL})"
     )
+    ap.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of transcripts to summarize in parallel (default: 4)"
+    )
+    ap.add_argument(
+        "--atomic-write",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Write summaries via a temp file and rename (default: enabled)"
+    )
+    ap.add_argument(
+        "--sorted",
+        action="store_true",
+        help="Process transcripts in file name order instead of directory order"
+    )
     args = ap.parse_args()
 
-    in_dir = Path(os.path.expanduser(args.input_dir))
-    out_dir = Path(os.path.expanduser(args.output_dir))
+    in_dir = Path(expand_home(args.input_dir))
+    out_dir = Path(expand_home(args.output_dir))
+    asset_template = expand_home(args.asset_template) if args.asset_template else None
 
     if not in_dir.exists():
         emit("error", error=f"Input directory does not exist: {in_dir}")
@@ -280,7 +624,7 @@ def main():
     in_dir.mkdir(parents=True, exist_ok=True)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    pending = list_pending_files(in_dir)
+    pending = list_pending_files(in_dir, sort=args.sorted)
     emit("status", message=f"Found {len(pending)} pending transcripts", input_dir=str(in_dir))
 
     if not pending:
@@ -290,28 +634,69 @@ def main():
     results = []
     failed = 0
 
-    for i, src_path in enumerate(pending):
-        emit("progress", file=str(src_path), index=i, total=len(pending), stage="starting")
+    # Watch the input directory so stability checks wake on write events
+    tracker = None
+    observer = None
+    if Observer is not None:
+        tracker = _WriteTracker()
+        observer = Observer()
         try:
-            result = process_file(
-                src_path,
-                out_dir,
-                args.endpoint,
-                args.model,
-                args.asset_template
-            )
-            result["success"] = True
-            results.append(result)
-            emit("success", **result)
-        except Exception as e:
-            failed += 1
-            result = {
-                "source": str(src_path),
-                "success": False,
-                "error": str(e)
-            }
-            results.append(result)
-            emit("error", file=str(src_path), error=str(e))
+            observer.schedule(tracker, str(in_dir), recursive=False)
+            observer.start()
+        except OSError:
+            # e.g. inotify watch limit reached; fall back to polling
+            tracker = None
+            observer = None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+            futures = {}
+            try:
+                for i, src_path in enumerate(pending):
+                    emit(
+                        "progress",
+                        flush=False,
+                        file=str(src_path),
+                        index=i,
+                        total=len(pending),
+                        stage="starting"
+                    )
+                    future = pool.submit(
+                        process_file,
+                        src_path,
+                        out_dir,
+                        args.endpoint,
+                        args.model,
+                        asset_template,
+                        tracker,
+                        args.atomic_write
+                    )
+                    futures[future] = src_path
+
+                for future in as_completed(futures):
+                    src_path = futures[future]
+                    try:
+                        result = future.result()
+                        result["success"] = True
+                        results.append(result)
+                        emit("success", **result)
+                    except Exception as e:
+                        failed += 1
+                        result = {
+                            "source": str(src_path),
+                            "success": False,
+                            "error": str(e)
+                        }
+                        results.append(result)
+                        emit("error", file=str(src_path), error=str(e))
+            except BaseException:
+                # Interrupted: drop queued transcripts instead of summarizing them
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
     emit("complete", processed=len(pending) - failed, failed=failed, results=results)
 